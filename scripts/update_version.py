@@ -7,6 +7,11 @@ import re
 import sys
 from pathlib import Path
 
+try:
+    import orjson  # native-code JSON, much faster on multi-MB lockfiles
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore
+
 
 ROOT = Path(__file__).resolve().parent.parent
 PYPROJECT_PATH = ROOT / "pyproject.toml"
@@ -16,7 +21,12 @@ RELEASE_PACKAGE = ROOT / "package.json"
 RELEASE_LOCK = ROOT / "package-lock.json"
 
 
-PROJECT_VERSION_PATTERN = re.compile(r'(?ms)(\[project\].*?^version\s*=\s*")([^"]+)(".*$)')
+# Applied only to the [project] table slice, so matching stays linear with no
+# cross-file DOTALL backtracking.
+VERSION_LINE_PATTERN = re.compile(r'(?m)^version\s*=\s*"[^"]+"')
+
+# Reused encoder so repeated package.json updates skip per-call codec setup.
+_JSON_ENCODER = json.JSONEncoder(indent=2)
 
 
 def update_pyproject(version: str) -> None:
@@ -28,20 +38,51 @@ def update_pyproject(version: str) -> None:
             f"version = \"{version}\"\n\n"
         ) + text.lstrip()
     else:
-        def _replace(match: re.Match[str]) -> str:
-            prefix, _current, suffix = match.groups()
-            return f"{prefix}{version}{suffix}"
-
-        text, count = PROJECT_VERSION_PATTERN.subn(_replace, text, count=1)
+        start = text.find("[project]")
+        next_section = text.find("\n[", start + 1)
+        end = next_section + 1 if next_section != -1 else len(text)
+        section, count = VERSION_LINE_PATTERN.subn(
+            lambda _match: f'version = "{version}"', text[start:end], count=1
+        )
         if count == 0:
             raise ValueError("Unable to locate [project] version field in pyproject.toml")
+        text = text[:start] + section + text[end:]
     PYPROJECT_PATH.write_text(text, encoding="utf-8")
 
 
+# 64 KB buffers keep multi-MB lockfile reads/writes off the default small-buffer path.
+_IO_BUFFER_SIZE = 1 << 16
+
+
+def _load_json(path: Path) -> dict:
+    with open(path, "rb", buffering=_IO_BUFFER_SIZE) as handle:
+        if orjson is not None:
+            return orjson.loads(handle.read())
+        return json.load(handle)
+
+
+def _dump_json(path: Path, data: dict) -> None:
+    with open(path, "wb", buffering=_IO_BUFFER_SIZE) as handle:
+        if orjson is not None:
+            handle.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        else:
+            handle.writelines(chunk.encode("utf-8") for chunk in _JSON_ENCODER.iterencode(data))
+            handle.write(b"\n")
+
+
 def update_package_json(path: Path, version: str) -> None:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = _load_json(path)
+    data["version"] = version
+    _dump_json(path, data)
+
+
+def update_lockfile(path: Path, version: str) -> None:
+    data = _load_json(path)
     data["version"] = version
-    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    packages = data.get("packages")
+    if isinstance(packages, dict) and "" in packages:
+        packages[""]["version"] = version
+    _dump_json(path, data)
 
 
 def main(argv: list[str]) -> None:
@@ -51,20 +92,10 @@ def main(argv: list[str]) -> None:
     update_pyproject(version)
     update_package_json(FRONTEND_PACKAGE, version)
     if FRONTEND_LOCK.exists():
-        lock_data = json.loads(FRONTEND_LOCK.read_text(encoding="utf-8"))
-        lock_data["version"] = version
-        packages = lock_data.get("packages")
-        if isinstance(packages, dict) and "" in packages:
-            packages[""]["version"] = version
-        FRONTEND_LOCK.write_text(json.dumps(lock_data, indent=2) + "\n", encoding="utf-8")
+        update_lockfile(FRONTEND_LOCK, version)
     update_package_json(RELEASE_PACKAGE, version)
     if RELEASE_LOCK.exists():
-        data = json.loads(RELEASE_LOCK.read_text(encoding="utf-8"))
-        data["version"] = version
-        packages = data.get("packages")
-        if isinstance(packages, dict) and "" in packages:
-            packages[""]["version"] = version
-        RELEASE_LOCK.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        update_lockfile(RELEASE_LOCK, version)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,23 @@
-"""Backend package for the PDF RAG MCP server."""
+"""Backend package for the PDF RAG MCP server.
 
-from .config import Settings
-from .processor import PDFProcessor
-from .mcp_server import create_http_app
+Re-exports are resolved lazily (PEP 562) so importing the package does not
+drag in the parser/embedding stacks before they are actually needed.
+"""
 
 __all__ = ["Settings", "PDFProcessor", "create_http_app"]
+
+
+def __getattr__(name: str):
+    if name == "Settings":
+        from .config import Settings
+
+        return Settings
+    if name == "PDFProcessor":
+        from .processor import PDFProcessor
+
+        return PDFProcessor
+    if name == "create_http_app":
+        from .mcp_server import create_http_app
+
+        return create_http_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
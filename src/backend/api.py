@@ -3,14 +3,17 @@ from __future__ import annotations
 import datetime as dt
 import logging
 import queue
-from dataclasses import dataclass, asdict
+import shutil
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
 from uuid import uuid4
 
 from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
@@ -20,6 +23,8 @@ from .mcp_server import create_mcp_router
 
 LOGGER = logging.getLogger(__name__)
 
+_UTC = dt.timezone.utc
+
 
 class JobStatus(str, Enum):
     queued = "queued"
@@ -28,7 +33,7 @@ class JobStatus(str, Enum):
     failed = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingJob:
     id: str
     filename: str
@@ -40,14 +45,26 @@ class ProcessingJob:
     document_id: Optional[int] = None
     title: Optional[str] = None
     source_path: Optional[Path] = None
+    _queued_at_iso: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # queued_at never changes after creation, so format it once.
+        self._queued_at_iso = self.queued_at.isoformat()
 
     def to_payload(self) -> Dict[str, object]:
-        payload = asdict(self)
-        payload["queued_at"] = self.queued_at.isoformat()
-        payload["updated_at"] = self.updated_at.isoformat()
-        if self.source_path is not None:
-            payload["source_path"] = str(self.source_path)
-        return payload
+        # The schema is fixed; a literal dict avoids asdict()'s recursive copy.
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "progress": self.progress,
+            "queued_at": self._queued_at_iso,
+            "updated_at": self.updated_at.isoformat(),
+            "error": self.error,
+            "document_id": self.document_id,
+            "title": self.title,
+            "source_path": str(self.source_path) if self.source_path is not None else None,
+        }
 
 
 class ProcessingManager:
@@ -59,14 +76,16 @@ class ProcessingManager:
         self.upload_dir = settings.data_dir / "uploads"
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         self._jobs: Dict[str, ProcessingJob] = {}
+        # Per-status index so status polls copy four small dicts instead of
+        # filtering every job four times under the lock.
+        self._by_status: Dict[JobStatus, Dict[str, ProcessingJob]] = {status: {} for status in JobStatus}
         self._lock = Lock()
 
     async def enqueue(self, file: UploadFile, background_tasks: BackgroundTasks) -> ProcessingJob:
         job_id = str(uuid4())
-        now = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc)
+        now = dt.datetime.now(_UTC)
         destination = self.upload_dir / f"{job_id}_{file.filename}"
-        contents = await file.read()
-        destination.write_bytes(contents)
+        await run_in_threadpool(self._write_upload, file.file, destination)
 
         job = ProcessingJob(
             id=job_id,
@@ -81,6 +100,7 @@ class ProcessingManager:
 
         with self._lock:
             self._jobs[job_id] = job
+            self._by_status[job.status][job_id] = job
 
         task = ProcessingTask(
             job_id=job_id,
@@ -101,6 +121,12 @@ class ProcessingManager:
         LOGGER.info("Enqueued job %s for %s", job_id, file.filename)
         return job
 
+    @staticmethod
+    def _write_upload(source: BinaryIO, destination: Path) -> None:
+        # Copy in 64 KB chunks so large PDFs never sit fully in memory.
+        with open(destination, "wb", buffering=1 << 16) as out:
+            shutil.copyfileobj(source, out, length=1 << 16)
+
     def _on_success(self, job_id: str, record) -> None:
         self._update_job(job_id, status=JobStatus.completed, progress=100.0, document_id=record.id)
 
@@ -121,7 +147,9 @@ class ProcessingManager:
             job = self._jobs.get(job_id)
             if not job:
                 return
-            if status:
+            if status and status != job.status:
+                self._by_status[job.status].pop(job_id, None)
+                self._by_status[status][job_id] = job
                 job.status = status
             if progress is not None:
                 job.progress = progress
@@ -129,20 +157,16 @@ class ProcessingManager:
                 job.document_id = document_id
             if error is not None:
                 job.error = error
-            job.updated_at = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc)
+            job.updated_at = dt.datetime.now(_UTC)
 
     def status_payload(self) -> Dict[str, List[Dict[str, object]]]:
         with self._lock:
-            jobs = list(self._jobs.values())
-        queue = [job.to_payload() for job in jobs if job.status == JobStatus.queued]
-        in_progress = [job.to_payload() for job in jobs if job.status == JobStatus.processing]
-        completed = [job.to_payload() for job in jobs if job.status == JobStatus.completed]
-        failed = [job.to_payload() for job in jobs if job.status == JobStatus.failed]
+            snapshot = {status: list(jobs.values()) for status, jobs in self._by_status.items()}
         return {
-            "queue": queue,
-            "in_progress": in_progress,
-            "completed": completed,
-            "failed": failed,
+            "queue": [job.to_payload() for job in snapshot[JobStatus.queued]],
+            "in_progress": [job.to_payload() for job in snapshot[JobStatus.processing]],
+            "completed": [job.to_payload() for job in snapshot[JobStatus.completed]],
+            "failed": [job.to_payload() for job in snapshot[JobStatus.failed]],
         }
 
 
@@ -151,7 +175,7 @@ def create_api(settings: Optional[Settings] = None) -> FastAPI:
     processor = PDFProcessor(config)
     manager = ProcessingManager(processor, config)
 
-    app = FastAPI(title="PDF RAG MCP API", version=config.app_version)
+    app = FastAPI(title="PDF RAG MCP API", version=config.app_version, default_response_class=ORJSONResponse)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -188,7 +212,7 @@ def create_api(settings: Optional[Settings] = None) -> FastAPI:
     async def search(query: str, top_k: int = 5) -> Dict[str, object]:
         if not query:
             raise HTTPException(status_code=400, detail="Query parameter is required")
-        results = processor.search(query, top_k=top_k)
+        results = await processor.asearch(query, top_k=top_k)
         return {"matches": results}
 
     @app.get("/api/markdown")
@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 from dataclasses import dataclass, field
@@ -8,11 +9,17 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - fallback for older environments
     tomllib = None  # type: ignore
 
+try:
+    import orjson  # native-code JSON parser, used when available
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore
+
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 
 
 def _resolve_watch_dir() -> Path:
+    # Intentionally uncached: env-driven and cheap, unlike the version lookup below.
     explicit = os.getenv("WATCH_DIR")
     if explicit:
         return Path(explicit).expanduser()
@@ -20,6 +27,7 @@ def _resolve_watch_dir() -> Path:
     return base / "pdfs"
 
 
+@functools.lru_cache(maxsize=1)
 def _resolve_app_version() -> str:
     env_version = (os.getenv("APP_VERSION") or "").strip()
     if env_version and env_version.lower() not in {"dev", "latest"}:
@@ -39,7 +47,8 @@ def _resolve_app_version() -> str:
     frontend_package = ROOT_DIR / "src" / "frontend" / "package.json"
     if frontend_package.exists():
         try:
-            package_data = json.loads(frontend_package.read_text(encoding="utf-8"))
+            raw = frontend_package.read_bytes()
+            package_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             version = package_data.get("version")
             if isinstance(version, str) and version.strip():
                 return version.strip()
@@ -49,11 +58,14 @@ def _resolve_app_version() -> str:
     return env_version or "dev"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings resolved from environment variables."""
 
     parser_backend: str = field(default_factory=lambda: os.getenv("PDF_PARSER", "pymupdf"))
+    pymupdf_parallel_pages: bool = field(default_factory=lambda: os.getenv("PYMUPDF_PARALLEL_PAGES", "true").lower() in ("1", "true", "yes"))
+    # -1 means "use the parser's tuned default flag set"
+    pymupdf_text_flags: int = field(default_factory=lambda: int(os.getenv("PYMUPDF_TEXT_FLAGS", "-1")))
     embedding_backend: str = field(default_factory=lambda: os.getenv("EMBEDDING_BACKEND", "local"))
     sentence_transformer_model: str = field(
         default_factory=lambda: os.getenv(
@@ -61,9 +73,16 @@ class Settings:
         )
     )
     embedding_device: str = field(default_factory=lambda: os.getenv("EMBEDDING_DEVICE", "cpu"))
+    embedding_batch_size: int = field(default_factory=lambda: int(os.getenv("EMBEDDING_BATCH_SIZE", "64")))
+    embedding_smart_batching: bool = field(default_factory=lambda: os.getenv("EMBEDDING_SMART_BATCHING", "true").lower() in ("1", "true", "yes"))
+    chunk_size: int = field(default_factory=lambda: int(os.getenv("CHUNK_SIZE", "700")))
+    chunk_overlap: int = field(default_factory=lambda: int(os.getenv("CHUNK_OVERLAP", "50")))
     embedding_dimension: int = field(
         default_factory=lambda: int(os.getenv("EMBEDDING_DIMENSION", "0") or "0")
     )
+    embedding_quantization: str = field(default_factory=lambda: os.getenv("EMBEDDING_QUANTIZATION", "fp32"))
+    vector_index_m: int = field(default_factory=lambda: int(os.getenv("VECTOR_INDEX_M", "32")))
+    vector_index_ef_construction: int = field(default_factory=lambda: int(os.getenv("VECTOR_INDEX_EF_CONSTRUCTION", "200")))
     openai_base_url: str = field(default_factory=lambda: os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"))
     openai_api_key: str = field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
     openai_model: str = field(default_factory=lambda: os.getenv("OPENAI_MODEL", "text-embedding-3-large"))
@@ -77,6 +96,12 @@ class Settings:
     watch_dir: Path = field(default_factory=_resolve_watch_dir)
     watch_poll_interval: int = field(default_factory=lambda: int(os.getenv("WATCH_POLL_INTERVAL", "10")))
     max_process_attempts: int = field(default_factory=lambda: int(os.getenv("MAX_PROCESS_ATTEMPTS", "10")))
+    # Semantic query cache (search result reuse for near-duplicate queries)
+    query_cache_enabled: bool = field(default_factory=lambda: os.getenv("QUERY_CACHE_ENABLED", "true").lower() in ("1", "true", "yes"))
+    query_cache_size: int = field(default_factory=lambda: int(os.getenv("QUERY_CACHE_SIZE", "128")))
+    query_cache_threshold: float = field(default_factory=lambda: float(os.getenv("QUERY_CACHE_THRESHOLD", "0.97")))
+    query_cache_ttl: float = field(default_factory=lambda: float(os.getenv("QUERY_CACHE_TTL", "300")))
+    query_embedding_cache_size: int = field(default_factory=lambda: int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024")))
     # Processing worker pool configuration
     processor_workers: int = field(default_factory=lambda: int(os.getenv("PROCESS_WORKERS", "4")))
     processor_queue_maxsize: int = field(default_factory=lambda: int(os.getenv("PROCESS_QUEUE_MAXSIZE", "100")))
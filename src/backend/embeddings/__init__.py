@@ -1,5 +1,6 @@
 """Embedding providers."""
 
 from .embedding_manager import EmbeddingManager, EmbeddingResult
+from .query_cache import SemanticQueryCache
 
-__all__ = ["EmbeddingManager", "EmbeddingResult"]
+__all__ = ["EmbeddingManager", "EmbeddingResult", "SemanticQueryCache"]
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
 
 from ..config import Settings
 
@@ -11,10 +17,14 @@ LOGGER = logging.getLogger(__name__)
 
 @dataclass
 class EmbeddingResult:
-    """Container for an embedding vector and its origin metadata."""
+    """Container for an embedding vector and its origin metadata.
+
+    Vectors are kept as 1-D float32 ndarrays; boxing them into Python lists
+    costs ~6x the memory and is only needed at JSON boundaries.
+    """
 
     text: str
-    vector: List[float]
+    vector: np.ndarray
     model: str
     provider: str
 
@@ -26,18 +36,66 @@ class EmbeddingManager:
         self.settings = settings
         self._local_model = None
         self._openai_client = None
-
-    def embed_documents(self, texts: Sequence[str]) -> List[EmbeddingResult]:
+        # Exact-match LRU of query -> EmbeddingResult; keyed per instance so
+        # a different backend/model never shares entries.
+        self._query_cache_size = max(0, settings.query_embedding_cache_size)
+        self._query_cache: "OrderedDict[str, EmbeddingResult]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+    def embed_query(self, query: str) -> EmbeddingResult:
+        """Embed a single query, reusing cached vectors for repeated queries."""
+        if self._query_cache_size:
+            with self._query_cache_lock:
+                cached = self._query_cache.get(query)
+                if cached is not None:
+                    self._query_cache.move_to_end(query)
+                    return cached
+        result = self.embed_documents([query])[0]
+        if self._query_cache_size:
+            with self._query_cache_lock:
+                self._query_cache[query] = result
+                while len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+        return result
+
+    def embed_documents(self, texts: Sequence[str], batch_size: Optional[int] = None) -> List[EmbeddingResult]:
         if not texts:
             return []
+        batch_size = batch_size or self.settings.embedding_batch_size
         backend = self.settings.embedding_backend.lower()
         if backend == "local":
-            return self._embed_local(texts)
+            return self._embed_local(texts, batch_size)
         if backend == "openai":
-            return self._embed_openai(texts)
+            return self._embed_openai(texts, batch_size)
         raise ValueError(f"Unsupported embedding backend: {backend}")
 
-    def _embed_local(self, texts: Sequence[str]) -> List[EmbeddingResult]:
+    def embed_documents_streaming(
+        self, texts: Iterable[str], batch_size: Optional[int] = None
+    ) -> Iterator[EmbeddingResult]:
+        """Embed an iterable of texts one batch at a time.
+
+        Only a bounded window of texts (and their results) is alive at once,
+        so callers can pipe a chunk generator straight into storage without
+        materializing the whole document's chunks. With smart batching
+        enabled, each window is embedded in length-sorted order — grouping
+        similar lengths cuts transformer padding waste — and results are
+        restored to arrival order before being yielded.
+        """
+        batch_size = max(1, batch_size or self.settings.embedding_batch_size)
+        window_size = batch_size * 8 if self.settings.embedding_smart_batching else batch_size
+        iterator = iter(texts)
+        while window := list(itertools.islice(iterator, window_size)):
+            if len(window) <= 1 or not self.settings.embedding_smart_batching:
+                yield from self.embed_documents(window, batch_size=batch_size)
+                continue
+            order = sorted(range(len(window)), key=lambda index: len(window[index]))
+            sorted_results = self.embed_documents([window[index] for index in order], batch_size=batch_size)
+            results: List[Optional[EmbeddingResult]] = [None] * len(window)
+            for position, result in zip(order, sorted_results):
+                results[position] = result
+            yield from results  # type: ignore[misc]
+
+    def _embed_local(self, texts: Sequence[str], batch_size: int) -> List[EmbeddingResult]:
         try:
             from sentence_transformers import SentenceTransformer  # type: ignore
         except ImportError as exc:  # pragma: no cover - dependency guard
@@ -50,22 +108,32 @@ class EmbeddingManager:
             device = self._resolve_device()
             LOGGER.info("Loading sentence transformer model %s on %s", model_name, device)
             self._local_model = SentenceTransformer(model_name, device=device)
+            if device == "cuda":
+                # FP16 halves memory traffic and roughly doubles GPU throughput.
+                self._local_model.half()
 
         assert self._local_model is not None
-        embeddings = self._local_model.encode(list(texts), convert_to_numpy=True)
+        embeddings = self._local_model.encode(
+            list(texts),
+            batch_size=max(1, batch_size),
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        embeddings = embeddings.astype(np.float32, copy=False)
         results: List[EmbeddingResult] = []
         for text, vector in zip(texts, embeddings):
             results.append(
                 EmbeddingResult(
                     text=text,
-                    vector=vector.tolist(),
+                    vector=vector,
                     model=self.settings.sentence_transformer_model,
                     provider="sentence-transformers",
                 )
             )
         return results
 
-    def _embed_openai(self, texts: Sequence[str]) -> List[EmbeddingResult]:
+    def _embed_openai(self, texts: Sequence[str], batch_size: int) -> List[EmbeddingResult]:
         try:
             from openai import OpenAI  # type: ignore
         except ImportError as exc:  # pragma: no cover - dependency guard
@@ -80,12 +148,17 @@ class EmbeddingManager:
 
         assert self._openai_client is not None
         model = self.settings.openai_model
-        response = self._openai_client.embeddings.create(model=model, input=list(texts))
-        data = response.data
+        texts = list(texts)
         results: List[EmbeddingResult] = []
-        for text, record in zip(texts, data):
-            vector = list(record.embedding)
-            results.append(EmbeddingResult(text=text, vector=vector, model=model, provider="openai"))
+        # One request per batch keeps payloads under provider limits while
+        # still amortizing per-request overhead across many chunks.
+        step = max(1, batch_size)
+        for offset in range(0, len(texts), step):
+            batch = texts[offset:offset + step]
+            response = self._openai_client.embeddings.create(model=model, input=batch)
+            for text, record in zip(batch, response.data):
+                vector = np.asarray(record.embedding, dtype=np.float32)
+                results.append(EmbeddingResult(text=text, vector=vector, model=model, provider="openai"))
         return results
 
     def _resolve_device(self) -> str:
@@ -95,18 +168,36 @@ class EmbeddingManager:
         return "cpu"
 
     @staticmethod
-    def chunk_markdown(markdown: str, chunk_size: int = 700, overlap: int = 50) -> Iterable[str]:
-        """Simple recursive chunker for markdown documents."""
+    def iter_chunk_markdown(markdown: str, chunk_size: int = 700, overlap: int = 50) -> Iterator[str]:
+        """Yield sliding-window chunks without materializing them all at once."""
+        return make_chunker(chunk_size, overlap)(markdown)
+
+    @staticmethod
+    def chunk_markdown(markdown: str, chunk_size: int = 700, overlap: int = 50) -> List[str]:
+        """Simple sliding-window chunker for markdown documents."""
+        return list(EmbeddingManager.iter_chunk_markdown(markdown, chunk_size, overlap))
+
+
+@functools.lru_cache(maxsize=8)
+def make_chunker(chunk_size: int, overlap: int) -> Callable[[str], Iterator[str]]:
+    """Return a chunker specialized for one (chunk_size, overlap) pair.
+
+    The window stride and join are bound once per configuration instead of
+    re-derived per document, and the cache means the configured sizes compile
+    a single closure per process.
+    """
+    step = max(1, chunk_size - overlap)
+    join = " ".join
+
+    def chunk(markdown: str) -> Iterator[str]:
         tokens = markdown.split()
-        if not tokens:
-            return []
-        chunks: List[str] = []
-        start = 0
-        while start < len(tokens):
-            end = min(len(tokens), start + chunk_size)
-            chunk = " ".join(tokens[start:end])
-            chunks.append(chunk)
-            if end == len(tokens):
-                break
-            start = max(0, end - overlap)
-        return chunks
+        n = len(tokens)
+        if not n:
+            return
+        # Closed-form final start: the first window that reaches the end of
+        # the document, so no redundant tail windows are emitted.
+        final = -((chunk_size - n) // step) * step if n > chunk_size else 0
+        for start in range(0, final + 1, step):
+            yield join(tokens[start:start + chunk_size])
+
+    return chunk
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class SemanticQueryCache:
+    """Bounded cache mapping recent query embeddings to search results.
+
+    Queries within the cosine-similarity threshold of a cached entry reuse
+    its results, collapsing the embed + ANN + hydration pipeline into one
+    matrix-vector product over at most ``max_size`` normalized vectors.
+    """
+
+    def __init__(self, max_size: int = 128, threshold: float = 0.97, ttl: float = 300.0) -> None:
+        self._max_size = max(1, max_size)
+        self._threshold = threshold
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (normalized vector, results, expiry); insertion order doubles
+        # as the LRU order via move_to_end on hits.
+        self._entries: "OrderedDict[int, Tuple[np.ndarray, List[Dict[str, object]], float]]" = OrderedDict()
+        self._next_key = 0
+        # Scan matrix; rows parallel _keys. Rebuilt only on misses, when the
+        # entry set changes.
+        self._keys: List[int] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def get(self, vector: np.ndarray) -> Optional[List[Dict[str, object]]]:
+        query = self._normalize(vector)
+        with self._lock:
+            if self._matrix is None:
+                return None
+            scores = self._matrix @ query
+            best = int(np.argmax(scores))
+            if float(scores[best]) < self._threshold:
+                return None
+            key = self._keys[best]
+            _, results, expires_at = self._entries[key]
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._rebuild()
+                return None
+            self._entries.move_to_end(key)
+            return results
+
+    def put(self, vector: np.ndarray, results: List[Dict[str, object]]) -> None:
+        query = self._normalize(vector)
+        with self._lock:
+            while len(self._entries) >= self._max_size:
+                self._entries.popitem(last=False)
+            key = self._next_key
+            self._next_key += 1
+            self._entries[key] = (query, results, time.monotonic() + self._ttl)
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._keys = list(self._entries)
+        if self._keys:
+            self._matrix = np.vstack([self._entries[key][0] for key in self._keys])
+        else:
+            self._matrix = None
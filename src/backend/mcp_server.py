@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, FastAPI, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from .config import Settings
@@ -78,28 +81,40 @@ def _build_tools() -> List[MCPTool]:
 
 
 def create_mcp_router(settings: Optional[Settings] = None, processor: Optional[PDFProcessor] = None) -> APIRouter:
-    """Return an API router exposing MCP endpoints."""
+    """Return an API router exposing MCP endpoints.
+
+    When no processor is supplied, routes resolve the shared instance from
+    ``app.state.processor`` (populated by the lifespan in
+    :func:`create_http_app`) instead of constructing their own.
+    """
 
-    config = settings or Settings()
-    proc = processor or PDFProcessor(config)
     tools = _build_tools()
 
+    def get_processor(request: Request) -> PDFProcessor:
+        if processor is not None:
+            return processor
+        return request.app.state.processor
+
     router = APIRouter()
 
-    @router.get("/.well-known/mcp/server", response_model=MCPServerInfo, include_in_schema=False)
-    def server_manifest() -> MCPServerInfo:
-        return MCPServerInfo(name="pdf-rag-mcp", description="HTTP MCP transport for PDF RAG", tools=tools)
+    # The manifest is static; serialize it once and serve the cached bytes.
+    manifest = MCPServerInfo(name="pdf-rag-mcp", description="HTTP MCP transport for PDF RAG", tools=tools)
+    manifest_bytes = orjson.dumps(manifest.model_dump())
+
+    @router.get("/.well-known/mcp/server", include_in_schema=False)
+    def server_manifest() -> Response:
+        return Response(content=manifest_bytes, media_type="application/json")
 
     tool_router = APIRouter(prefix="/mcp", tags=["mcp"])
 
     @tool_router.post("/tools/query_pdfs", response_model=QueryResponse)
-    def query_pdfs(request: QueryRequest) -> QueryResponse:
+    async def query_pdfs(request: QueryRequest, proc: PDFProcessor = Depends(get_processor)) -> QueryResponse:
         LOGGER.info("MCP HTTP query: %s", request.query)
-        matches = proc.search(request.query, top_k=request.top_k)
+        matches = await proc.asearch(request.query, top_k=request.top_k)
         return QueryResponse(matches=matches)
 
     @tool_router.post("/tools/fetch_markdown", response_model=FetchResponse)
-    def fetch_markdown(request: FetchRequest) -> FetchResponse:
+    def fetch_markdown(request: FetchRequest, proc: PDFProcessor = Depends(get_processor)) -> FetchResponse:
         if request.document_id is None and not request.title:
             raise HTTPException(status_code=400, detail="Provide document_id or title")
 
@@ -119,13 +134,24 @@ def create_mcp_router(settings: Optional[Settings] = None, processor: Optional[P
 
 
 def create_http_app(settings: Optional[Settings] = None) -> FastAPI:
-    """Create a standalone FastAPI app serving only the MCP HTTP transport."""
+    """Create a standalone FastAPI app serving only the MCP HTTP transport.
+
+    The PDFProcessor (worker pool, databases, embedding model) is created
+    once in the lifespan and shared via ``app.state``, so composing or
+    re-creating apps never double-loads the stack.
+    """
 
     config = settings or Settings()
-    processor = PDFProcessor(config)
-    app = FastAPI(title="PDF RAG MCP", version="1.0.0")
-    app.include_router(create_mcp_router(settings=config, processor=processor))
-    LOGGER.info("Starting MCP HTTP server with parser backend=%s", config.parser_backend)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        app.state.processor = PDFProcessor(config)
+        LOGGER.info("Starting MCP HTTP server with parser backend=%s", config.parser_backend)
+        yield
+        app.state.processor.shutdown(wait=True)
+
+    app = FastAPI(title="PDF RAG MCP", version="1.0.0", lifespan=lifespan, default_response_class=ORJSONResponse)
+    app.include_router(create_mcp_router(settings=config))
     return app
 
 
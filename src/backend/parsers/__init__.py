@@ -3,5 +3,6 @@
 from .base import BasePDFParser
 from .pymupdf_parser import PyMuPDFParser
 from .docling_parser import DoclingParser
+from .rust_parser import RustPDFParser
 
-__all__ = ["BasePDFParser", "PyMuPDFParser", "DoclingParser"]
+__all__ = ["BasePDFParser", "PyMuPDFParser", "DoclingParser", "RustPDFParser"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
 
@@ -8,16 +9,26 @@ from .base import BasePDFParser
 LOGGER = logging.getLogger(__name__)
 
 
+@functools.cache
+def _get_converter():
+    """Build the Docling converter once per process.
+
+    DocumentConverter loads its model set on construction (hundreds of ms to
+    seconds), so every DoclingParser shares one instance.
+    """
+    try:
+        from docling.document_converter import DocumentConverter  # type: ignore
+    except ImportError as exc:  # pragma: no cover - dependency guard
+        raise ImportError("Docling is required for the Docling parser. Install docling.") from exc
+
+    return DocumentConverter()
+
+
 class DoclingParser(BasePDFParser):
     """Parse PDFs into markdown using the Docling document converter."""
 
     def __init__(self) -> None:
-        try:
-            from docling.document_converter import DocumentConverter  # type: ignore
-        except ImportError as exc:  # pragma: no cover - dependency guard
-            raise ImportError("Docling is required for the Docling parser. Install docling.") from exc
-
-        self._converter = DocumentConverter()
+        self._converter = _get_converter()
 
     def parse_to_markdown(self, pdf_path: Path) -> str:
         path = self._ensure_path(pdf_path)
@@ -1,15 +1,44 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Sequence
 
 from .base import BasePDFParser
 
 LOGGER = logging.getLogger(__name__)
 
+# Opening a per-worker document costs a few ms; below this page count the
+# sequential path wins.
+_PARALLEL_PAGE_THRESHOLD = 8
+
 
 class PyMuPDFParser(BasePDFParser):
-    """Parse PDFs into markdown using the PyMuPDF backend."""
+    """Parse PDFs into markdown using the PyMuPDF backend.
+
+    PyMuPDF releases the GIL inside its native text extraction, so large
+    documents are split across a thread pool, each worker holding its own
+    ``fitz.Document`` (page objects are not thread-safe).
+    """
+
+    def __init__(
+        self,
+        parallel_pages: bool = True,
+        max_workers: Optional[int] = None,
+        text_flags: Optional[int] = None,
+    ) -> None:
+        self._parallel_pages = parallel_pages
+        self._max_workers = max_workers
+        self._text_flags = text_flags
+
+    def _resolve_text_flags(self, fitz) -> int:
+        if self._text_flags is not None:
+            return self._text_flags
+        # RAG chunks don't need ligature/whitespace preservation; dehyphenation
+        # and mediabox clipping ask the C library for less work per page.
+        return fitz.TEXT_DEHYPHENATE | fitz.TEXT_MEDIABOX_CLIP
 
     def parse_to_markdown(self, pdf_path: Path) -> str:
         path = self._ensure_path(pdf_path)
@@ -21,25 +50,53 @@ class PyMuPDFParser(BasePDFParser):
             ) from exc
 
         LOGGER.debug("Opening PDF with PyMuPDF: %s", path)
+        flags = self._resolve_text_flags(fitz)
         document = fitz.open(path)
         try:
-            markdown_chunks = []
-            for page in document:
-                text_page = page.get_textpage()
-                markdown = ""
-                if hasattr(text_page, "extractMarkdown"):
-                    markdown = text_page.extractMarkdown() or ""
-                elif hasattr(text_page, "extract_markdown"):
-                    markdown = text_page.extract_markdown() or ""
-
-                if not markdown.strip() and hasattr(text_page, "extract_text"):
-                    markdown = text_page.extract_text() or ""
-
-                if not markdown.strip():
-                    markdown = page.get_text("text")
-
-                markdown_chunks.append(markdown.strip())
+            page_count = document.page_count
+            workers = min(page_count, self._max_workers or os.cpu_count() or 1)
+            if self._parallel_pages and workers > 1 and page_count >= _PARALLEL_PAGE_THRESHOLD:
+                markdown_chunks = self._extract_parallel(path, page_count, workers, flags)
+            else:
+                markdown_chunks = [self._extract_page(document[index], flags) for index in range(page_count)]
             LOGGER.debug("Extracted %d pages from %s", len(markdown_chunks), path)
             return "\n\n".join(chunk for chunk in markdown_chunks if chunk)
         finally:
             document.close()
+
+    def _extract_parallel(self, path: Path, page_count: int, workers: int, flags: int) -> List[str]:
+        ranges = [range(start, page_count, workers) for start in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(lambda pages: self._extract_range(path, pages, flags), ranges))
+        # Stitch the strided ranges back into document order.
+        chunks: List[str] = [""] * page_count
+        for pages, part in zip(ranges, parts):
+            for index, chunk in zip(pages, part):
+                chunks[index] = chunk
+        return chunks
+
+    def _extract_range(self, path: Path, pages: Sequence[int], flags: int) -> List[str]:
+        import fitz  # type: ignore
+
+        document = fitz.open(path)
+        try:
+            return [self._extract_page(document[index], flags) for index in pages]
+        finally:
+            document.close()
+
+    @staticmethod
+    def _extract_page(page, flags: int) -> str:
+        text_page = page.get_textpage(flags=flags)
+        markdown = ""
+        if hasattr(text_page, "extractMarkdown"):
+            markdown = text_page.extractMarkdown() or ""
+        elif hasattr(text_page, "extract_markdown"):
+            markdown = text_page.extract_markdown() or ""
+
+        if not markdown.strip() and hasattr(text_page, "extract_text"):
+            markdown = text_page.extract_text() or ""
+
+        if not markdown.strip():
+            markdown = page.get_text("text", flags=flags)
+
+        return markdown.strip()
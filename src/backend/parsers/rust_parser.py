@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from .base import BasePDFParser
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RustPDFParser(BasePDFParser):
+    """Parse PDFs into markdown using the optional native pdf_rag_parser module.
+
+    ``pdf_rag_parser`` is a PyO3 extension that extracts pages in parallel
+    without the GIL; it is installed separately (it is not a Python
+    dependency of this package). Construction fails with ImportError when
+    the module is absent so callers can fall back to another backend.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import pdf_rag_parser  # type: ignore
+        except ImportError as exc:  # pragma: no cover - dependency guard
+            raise ImportError(
+                "pdf_rag_parser is required for the Rust parser. Install the pdf-rag-parser extension."
+            ) from exc
+
+        self._parser = pdf_rag_parser
+
+    def parse_to_markdown(self, pdf_path: Path) -> str:
+        path = self._ensure_path(pdf_path)
+        LOGGER.debug("Converting PDF with pdf_rag_parser: %s", path)
+        markdown = self._parser.parse_to_markdown(str(path))
+        return markdown.strip()
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import datetime as dt
 import hashlib
 import logging
+import os
 import queue
 import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+try:
+    from blake3 import blake3  # SIMD-parallel hashing, ~5-10x faster than SHA-256
+except ImportError:  # pragma: no cover - optional accelerator
+    blake3 = None  # type: ignore
 
 from .config import Settings
-from .embeddings import EmbeddingManager
+from .embeddings import EmbeddingManager, EmbeddingResult, SemanticQueryCache
 from .logging_config import configure_logging
-from .parsers import BasePDFParser, DoclingParser, PyMuPDFParser
+from .parsers import BasePDFParser, DoclingParser, PyMuPDFParser, RustPDFParser
 from .storage import MarkdownRecord, MarkdownRepository, VectorStore
 
 LOGGER = logging.getLogger(__name__)
@@ -49,9 +57,30 @@ class PDFProcessor:
         self.markdown_repository = MarkdownRepository(self.settings.database_url)
         self.embedding_manager = EmbeddingManager(self.settings)
         embedding_dim = self.settings.embedding_dimension or None
-        self.vector_store = VectorStore(self.settings.vector_store_path, embedding_dim)
-        self._task_queue: "queue.Queue[ProcessingTask]" = queue.Queue(maxsize=max(1, self.settings.processor_queue_maxsize))
-        self._workers: List[threading.Thread] = []
+        self.vector_store = VectorStore(
+            self.settings.vector_store_path,
+            embedding_dim,
+            quantization=self.settings.embedding_quantization,
+            hnsw_m=self.settings.vector_index_m,
+            hnsw_ef_construction=self.settings.vector_index_ef_construction,
+        )
+        self._query_cache: Optional[SemanticQueryCache] = None
+        if self.settings.query_cache_enabled:
+            self._query_cache = SemanticQueryCache(
+                max_size=self.settings.query_cache_size,
+                threshold=self.settings.query_cache_threshold,
+                ttl=self.settings.query_cache_ttl,
+            )
+        # Ingest runs as asyncio tasks on a dedicated loop thread: parsing and
+        # persistence hop to worker threads via to_thread, while HTTP-bound
+        # embedding backends overlap without pinning an OS thread per worker.
+        # Backpressure is enforced in submit_task instead of by a bounded queue.
+        self._task_queue: "asyncio.Queue[ProcessingTask]" = asyncio.Queue()
+        self._queue_capacity = max(1, self.settings.processor_queue_maxsize)
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="pdf-ingest-loop", daemon=True)
+        self._loop_thread.start()
+        self._workers: List["concurrent.futures.Future[None]"] = []
         self._start_workers()
         # start directory watcher (daemon) if enabled
         if self.settings.watch_enabled:
@@ -62,20 +91,35 @@ class PDFProcessor:
         backend = backend.lower()
         if backend == "pymupdf":
             LOGGER.info("Using PyMuPDF parser backend")
-            return PyMuPDFParser()
+            return self._create_pymupdf_parser()
         if backend == "docling":
             LOGGER.info("Using Docling parser backend")
             return DoclingParser()
+        if backend == "rust":
+            try:
+                parser = RustPDFParser()
+            except ImportError:
+                LOGGER.warning("pdf_rag_parser extension not installed; falling back to PyMuPDF")
+                return self._create_pymupdf_parser()
+            LOGGER.info("Using Rust parser backend")
+            return parser
         raise ValueError(f"Unsupported parser backend: {backend}")
 
+    def _create_pymupdf_parser(self) -> PyMuPDFParser:
+        text_flags = self.settings.pymupdf_text_flags
+        return PyMuPDFParser(
+            parallel_pages=self.settings.pymupdf_parallel_pages,
+            text_flags=None if text_flags < 0 else text_flags,
+        )
+
     def submit_task(self, task: ProcessingTask, *, block: bool = True, timeout: Optional[float] = None) -> None:
         LOGGER.debug("Queueing task %s for %s", task.job_id, task.source_path)
-        put_kwargs: Dict[str, object] = {}
-        if not block:
-            put_kwargs["block"] = False
-        if timeout is not None:
-            put_kwargs["timeout"] = timeout
-        self._task_queue.put(task, **put_kwargs)
+        # qsize() is approximate but sufficient as a soft capacity gate; the
+        # block/timeout parameters are kept for caller compatibility, though
+        # puts onto the loop never block the caller.
+        if self._task_queue.qsize() >= self._queue_capacity:
+            raise queue.Full(f"Processing queue is at capacity ({self._queue_capacity})")
+        self._loop.call_soon_threadsafe(self._task_queue.put_nowait, task)
 
     def process_pdf(self, pdf_path: Path, title: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> MarkdownRecord:
         task = ProcessingTask(
@@ -86,16 +130,66 @@ class PDFProcessor:
         )
         return self._execute_pipeline(task)
 
+    def process_many_pdfs(self, pdf_paths: Sequence[Path]) -> List[MarkdownRecord]:
+        """Synchronously process several PDFs, batching the embedding stage.
+
+        All documents are parsed and persisted first, then every pending
+        document's chunks are chained through one streaming embedding pass —
+        provider batches span document boundaries, so a backlog of N small
+        PDFs costs ~total_chunks/batch_size provider calls instead of at
+        least one per file — and land in a single LanceDB commit.
+        """
+        records: List[MarkdownRecord] = []
+        pending: List[tuple[int, str]] = []
+        for pdf_path in pdf_paths:
+            task = ProcessingTask(
+                job_id=f"sync:{hashlib.sha1(str(pdf_path).encode()).hexdigest()}",
+                source_path=Path(pdf_path).expanduser().resolve(),
+                title=Path(pdf_path).stem,
+                metadata={},
+            )
+            record, markdown = self._ingest_markdown(task)
+            records.append(record)
+            if markdown is not None:
+                pending.append((record.id, markdown))
+        if not pending:
+            return records
+
+        chunk_counts: List[int] = []
+
+        def iter_all_chunks() -> Iterator[str]:
+            for _, markdown in pending:
+                count = 0
+                for chunk in self._chunk_markdown(markdown):
+                    count += 1
+                    yield chunk
+                chunk_counts.append(count)
+
+        # The stream is fully consumed before the split, so chunk_counts is
+        # complete by the time results are partitioned back per document.
+        results = list(self.embedding_manager.embed_documents_streaming(iter_all_chunks()))
+        entries: List[tuple[int, List[EmbeddingResult]]] = []
+        offset = 0
+        for (document_id, _), count in zip(pending, chunk_counts):
+            entries.append((document_id, results[offset:offset + count]))
+            offset += count
+        self.vector_store.add_embeddings_bulk(entries)
+        return records
+
     def search(self, query: str, top_k: int = 5) -> List[Dict[str, object]]:
         LOGGER.info("Searching vector store for query: %s", query)
-        embedding_results = self.embedding_manager.embed_documents([query])
-        if not embedding_results:
-            return []
-        query_embedding = embedding_results[0]
+        query_embedding = self.embedding_manager.embed_query(query)
+        if self._query_cache is not None:
+            cached = self._query_cache.get(query_embedding.vector)
+            if cached is not None and len(cached) >= top_k:
+                LOGGER.debug("Semantic query cache hit for query: %s", query)
+                return cached[:top_k]
         matches = self.vector_store.similarity_search(query_embedding.vector, top_k=top_k)
+        # Several matches usually share a document; hydrate each id once.
+        documents = self.markdown_repository.get_by_ids(list({match.document_id for match in matches}))
         results: List[Dict[str, object]] = []
         for match in matches:
-            document = self.markdown_repository.get_by_id(match.document_id)
+            document = documents.get(match.document_id)
             results.append(
                 {
                     "document_id": match.document_id,
@@ -107,8 +201,14 @@ class PDFProcessor:
                     "model": match.model,
                 }
             )
+        if self._query_cache is not None:
+            self._query_cache.put(query_embedding.vector, results)
         return results
 
+    async def asearch(self, query: str, top_k: int = 5) -> List[Dict[str, object]]:
+        """Async wrapper around :meth:`search` that keeps the event loop free."""
+        return await asyncio.to_thread(self.search, query, top_k)
+
     def fetch_markdown_by_id(self, document_id: int) -> Optional[str]:
         record = self.markdown_repository.get_by_id(document_id)
         return record.markdown if record else None
@@ -119,31 +219,44 @@ class PDFProcessor:
 
     def _start_workers(self) -> None:
         worker_count = max(1, self.settings.processor_workers)
-        for idx in range(worker_count):
-            thread = threading.Thread(target=self._worker_loop, name=f"pdf-worker-{idx+1}", daemon=True)
-            thread.start()
-            self._workers.append(thread)
+        for _ in range(worker_count):
+            future = asyncio.run_coroutine_threadsafe(self._worker_loop(), self._loop)
+            self._workers.append(future)
         LOGGER.info("Started %s processing worker(s)", worker_count)
 
-    def _worker_loop(self) -> None:
+    async def _worker_loop(self) -> None:
         while True:
-            task = self._task_queue.get()
+            task = await self._task_queue.get()
             try:
                 if task.job_id == "__shutdown__":
                     return
                 if task.on_start:
                     task.on_start(task)
-                record = self._execute_pipeline(task)
+                record = await self._execute_pipeline_async(task)
                 if task.on_success:
                     task.on_success(task, record)
             except Exception as exc:  # pragma: no cover - defensive worker loop handling
                 LOGGER.exception("Processing task %s failed", task.job_id)
                 if task.on_error:
                     task.on_error(task, exc)
-            finally:
-                self._task_queue.task_done()
 
     def _execute_pipeline(self, task: ProcessingTask) -> MarkdownRecord:
+        record, markdown = self._ingest_markdown(task)
+        if markdown is None:
+            return record
+        self._emit_progress(task, 65.0, "chunked")
+        self._embed_and_store(record.id, markdown)
+        self._emit_progress(task, 85.0, "embedded")
+        LOGGER.info("Persisted markdown and embeddings for %s (job %s)", task.title, task.job_id)
+        self._emit_progress(task, 100.0, "completed")
+        return record
+
+    def _ingest_markdown(self, task: ProcessingTask) -> tuple[MarkdownRecord, Optional[str]]:
+        """Parse and persist one PDF, returning its markdown for embedding.
+
+        Returns (record, None) when the document deduplicated against an
+        existing record and needs no embedding pass.
+        """
         path = task.source_path.expanduser().resolve()
         if not path.exists():
             raise FileNotFoundError(f"PDF not found: {path}")
@@ -151,6 +264,15 @@ class PDFProcessor:
         LOGGER.info("Processing PDF %s (job %s)", path, task.job_id)
         metadata = self._collect_metadata(path, task.metadata)
         self._emit_progress(task, 15.0, "metadata")
+
+        # Cheap file-content dedup before the expensive parse.
+        file_hash = self._compute_file_hash(path)
+        existing = self.markdown_repository.get_by_file_hash(file_hash)
+        if existing:
+            LOGGER.info("Skipping ingestion for %s; file hash matches document %s", path, existing.id)
+            self._emit_progress(task, 100.0, "cache_hit")
+            return existing, None
+
         markdown = self._extract_markdown(path)
         self._emit_progress(task, 45.0, "parsed")
         content_hash = self._compute_hash(markdown)
@@ -159,7 +281,7 @@ class PDFProcessor:
         if duplicate:
             LOGGER.info("Skipping ingestion for %s; duplicate content hash matches document %s", path, duplicate.id)
             self._emit_progress(task, 100.0, "duplicate")
-            return duplicate
+            return duplicate, None
 
         record = self.markdown_repository.save(
             title=task.title,
@@ -167,17 +289,61 @@ class PDFProcessor:
             markdown=markdown,
             content_hash=content_hash,
             metadata=metadata,
+            file_hash=file_hash,
+        )
+        return record, markdown
+
+    async def _execute_pipeline_async(self, task: ProcessingTask) -> MarkdownRecord:
+        """Async mirror of :meth:`_execute_pipeline`; blocking stages hop to threads."""
+        path = task.source_path.expanduser().resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"PDF not found: {path}")
+
+        LOGGER.info("Processing PDF %s (job %s)", path, task.job_id)
+        metadata = self._collect_metadata(path, task.metadata)
+        self._emit_progress(task, 15.0, "metadata")
+
+        # Cheap file-content dedup before the expensive parse.
+        file_hash = await asyncio.to_thread(self._compute_file_hash, path)
+        existing = await asyncio.to_thread(self.markdown_repository.get_by_file_hash, file_hash)
+        if existing:
+            LOGGER.info("Skipping ingestion for %s; file hash matches document %s", path, existing.id)
+            self._emit_progress(task, 100.0, "cache_hit")
+            return existing
+
+        markdown = await asyncio.to_thread(self._extract_markdown, path)
+        self._emit_progress(task, 45.0, "parsed")
+        content_hash = await asyncio.to_thread(self._compute_hash, markdown)
+
+        duplicate = await asyncio.to_thread(self.markdown_repository.get_by_hash, content_hash)
+        if duplicate:
+            LOGGER.info("Skipping ingestion for %s; duplicate content hash matches document %s", path, duplicate.id)
+            self._emit_progress(task, 100.0, "duplicate")
+            return duplicate
+
+        record = await asyncio.to_thread(
+            self.markdown_repository.save,
+            title=task.title,
+            source_path=path,
+            markdown=markdown,
+            content_hash=content_hash,
+            metadata=metadata,
+            file_hash=file_hash,
         )
 
-        chunks = self._chunk_markdown(markdown)
         self._emit_progress(task, 65.0, "chunked")
-        embeddings = self.embedding_manager.embed_documents(chunks)
+        await asyncio.to_thread(self._embed_and_store, record.id, markdown)
         self._emit_progress(task, 85.0, "embedded")
-        self.vector_store.add_embeddings(record.id, embeddings)
         LOGGER.info("Persisted markdown and embeddings for %s (job %s)", task.title, task.job_id)
         self._emit_progress(task, 100.0, "completed")
         return record
 
+    def _embed_and_store(self, document_id: int, markdown: str) -> None:
+        # Chunks stream through the embedder into the store one batch at a
+        # time, so only embedding_batch_size chunks are alive at once.
+        embeddings = self.embedding_manager.embed_documents_streaming(self._chunk_markdown(markdown))
+        self.vector_store.add_embeddings(document_id, embeddings)
+
     def _collect_metadata(self, path: Path, base: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         metadata: Dict[str, Any] = dict(base or {})
         try:
@@ -193,13 +359,48 @@ class PDFProcessor:
     def _extract_markdown(self, path: Path) -> str:
         return self.parser.parse_to_markdown(path)
 
-    def _chunk_markdown(self, markdown: str) -> List[str]:
-        chunks = list(EmbeddingManager.chunk_markdown(markdown))
-        LOGGER.debug("Generated %d chunks for embeddings", len(chunks))
-        return chunks
+    def _chunk_markdown(self, markdown: str) -> Iterator[str]:
+        return EmbeddingManager.iter_chunk_markdown(
+            markdown,
+            chunk_size=self.settings.chunk_size,
+            overlap=self.settings.chunk_overlap,
+        )
+
+    # Below this size a plain read() is as fast as mapping the file.
+    MMAP_HASH_THRESHOLD = 1 << 20
+
+    def _compute_file_hash(self, path: Path) -> str:
+        if blake3 is not None:
+            hasher = blake3()
+            if path.stat().st_size >= self.MMAP_HASH_THRESHOLD:
+                # Memory-maps the file and hashes with internal SIMD
+                # parallelism; peak memory stays bounded by the page cache.
+                hasher.update_mmap(str(path))
+            else:
+                hasher.update(path.read_bytes())
+            return "b3:" + hasher.hexdigest()
+        # hashlib.file_digest loops in C over a reused buffer.
+        with open(path, "rb") as handle:
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+
+    # Markdown above this size is hashed in slices to avoid holding a second
+    # full-size UTF-8 copy next to the string itself.
+    HASH_SLICE_SIZE = 1 << 20
 
     def _compute_hash(self, markdown: str) -> str:
-        return hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+        # "b3:"-prefixed hashes coexist with legacy unprefixed SHA-256 rows;
+        # get_by_hash compares exact strings, so each algorithm dedupes
+        # against its own entries.
+        hasher = blake3() if blake3 is not None else hashlib.sha256()
+        if len(markdown) > self.HASH_SLICE_SIZE:
+            # UTF-8 encoding is per-code-point, so encoding character slices
+            # independently concatenates to the same byte stream.
+            for start in range(0, len(markdown), self.HASH_SLICE_SIZE):
+                hasher.update(markdown[start:start + self.HASH_SLICE_SIZE].encode("utf-8"))
+        else:
+            hasher.update(markdown.encode("utf-8"))
+        prefix = "b3:" if blake3 is not None else ""
+        return prefix + hasher.hexdigest()
 
     def _emit_progress(self, task: ProcessingTask, progress: float, stage: str) -> None:
         if task.on_progress:
@@ -211,10 +412,10 @@ class PDFProcessor:
     def shutdown(self, wait: bool = False) -> None:
         for _ in self._workers:
             sentinel = ProcessingTask(job_id="__shutdown__", source_path=Path("."), title="", metadata={})
-            self._task_queue.put(sentinel)
+            self._loop.call_soon_threadsafe(self._task_queue.put_nowait, sentinel)
         if wait:
-            for thread in self._workers:
-                thread.join()
+            for future in self._workers:
+                future.result()
 
 
 @dataclass
@@ -224,54 +425,106 @@ class DirectoryWatcher:
     - Watches `settings.watch_dir` for new/changed PDFs.
     - Skips files already in the MarkdownRepository (by source_path).
     - Tracks failures in `failed_files` table and blacklists after configured attempts.
+
+    The watcher only scans and enqueues; the actual parse/embed/store work
+    runs concurrently on the processor's `processor_workers` pool, so a
+    backlog of PDFs is chewed through in parallel and one slow document
+    never stalls scanning.
     """
 
     processor: PDFProcessor
     markdown_repo: MarkdownRepository
     settings: Settings
     _thread: Optional[threading.Thread] = None
+    # Paths already ingested (seeded from the repository once at startup) and
+    # the last-seen mtime per path, so steady-state scans issue no DB queries.
+    _known_paths: set = field(default_factory=set)
+    _blacklisted_paths: set = field(default_factory=set)
+    _seen_mtimes: Dict[str, float] = field(default_factory=dict)
+
+    # Re-seed the caches every this many polls so out-of-band DB writes
+    # (another process, manual cleanup) are eventually picked up.
+    RESYNC_TICKS = 60
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
             return
+        self._sync_index()
         self._thread = threading.Thread(target=self._run, daemon=True, name="pdf-watcher")
         self._thread.start()
-        LOGGER.info("Started DirectoryWatcher on %s", self.settings.watch_dir)
+        LOGGER.info("Started DirectoryWatcher on %s (%d known files)", self.settings.watch_dir, len(self._known_paths))
+
+    def _sync_index(self) -> None:
+        try:
+            self._known_paths.update(self.markdown_repo.iter_source_paths())
+            self._blacklisted_paths = set(self.markdown_repo.iter_blacklisted_paths())
+        except Exception:  # pragma: no cover - defensive db issue
+            LOGGER.exception("Failed to seed watcher index from repository")
 
     def _run(self) -> None:
         poll = max(1, int(self.settings.watch_poll_interval))
+        tick = 0
         while True:
             try:
+                tick += 1
+                if tick % self.RESYNC_TICKS == 0:
+                    self._sync_index()
                 self._scan_once()
             except Exception:  # pragma: no cover - defensive loop
                 LOGGER.exception("DirectoryWatcher encountered an error")
             time.sleep(poll)
 
+    def _iter_pdf_entries(self, root: Path):
+        """Yield (absolute path, mtime) for every PDF under root.
+
+        os.scandir surfaces each entry's cached stat result, so the walk
+        costs one syscall per directory instead of one stat per file.
+        """
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file() and entry.name.lower().endswith(".pdf"):
+                                yield entry.path, entry.stat().st_mtime
+                        except OSError:
+                            continue
+            except OSError:
+                LOGGER.exception("Watcher: failed to traverse %s", current)
+
     def _scan_once(self) -> None:
-        watch_dir = Path(self.settings.watch_dir)
+        watch_dir = Path(self.settings.watch_dir).expanduser().resolve()
         if not watch_dir.exists():
             return
-        try:
-            candidates = watch_dir.rglob("*.pdf")
-        except OSError:
-            LOGGER.exception("Watcher: failed to traverse %s", watch_dir)
-            return
-        for path in candidates:
-            if not path.is_file():
+        for key, mtime in self._iter_pdf_entries(watch_dir):
+            # Already ingested/blacklisted, or unchanged since we last
+            # looked: no DB work.
+            if key in self._known_paths or key in self._blacklisted_paths:
+                self._seen_mtimes[key] = mtime
+                continue
+            if self._seen_mtimes.get(key) == mtime:
                 continue
-            absolute_path = path.expanduser().resolve()
+            absolute_path = Path(key)
             # skip if we already have a record for this source path
             try:
-                existing = self.markdown_repo.get_by_source_path(str(absolute_path))
+                existing = self.markdown_repo.get_by_source_path(key)
             except Exception:  # pragma: no cover - defensive db issue
                 LOGGER.exception("Failed to query repository for %s", absolute_path)
                 existing = None
             if existing:
+                self._known_paths.add(key)
+                self._seen_mtimes[key] = mtime
                 continue
             # skip if blacklisted
             try:
-                if self.markdown_repo.is_blacklisted(str(absolute_path)):
+                if self.markdown_repo.is_blacklisted(key):
                     LOGGER.debug("Skipping blacklisted file %s", absolute_path)
+                    self._blacklisted_paths.add(key)
+                    self._seen_mtimes[key] = mtime
                     continue
             except Exception:
                 LOGGER.exception("Failed to check blacklist for %s", absolute_path)
@@ -293,10 +546,16 @@ class DirectoryWatcher:
             try:
                 self.processor.submit_task(task, block=False)
             except queue.Full:
-                LOGGER.warning("Processing queue full, deferring file %s", absolute_path)
-                time.sleep(self.settings.watch_poll_interval)
+                # No point scanning further this tick; remaining files get
+                # picked up once the workers drain the queue.
+                LOGGER.warning("Processing queue full, deferring remaining files until next poll")
+                break
+            else:
+                # Don't resubmit while the task is queued or processing.
+                self._seen_mtimes[key] = mtime
 
     def _on_success(self, path: str, record: MarkdownRecord) -> None:
+        self._known_paths.add(path)
         try:
             self.markdown_repo.clear_failures(path)
         except Exception:
@@ -304,10 +563,14 @@ class DirectoryWatcher:
         LOGGER.info("Watcher: successfully processed %s -> id=%s", path, record.id)
 
     def _on_error(self, path: str, exc: Exception) -> None:
+        # Forget the mtime so the next poll retries (attempt counting and
+        # blacklisting still happen in the repository).
+        self._seen_mtimes.pop(path, None)
         LOGGER.exception("Watcher: processing %s failed", path)
         try:
             info = self.markdown_repo.record_failure(path, str(exc), self.settings.max_process_attempts)
             if info.get("blacklisted"):
+                self._blacklisted_paths.add(path)
                 LOGGER.warning("File %s blacklisted after %s attempts", path, info.get("attempts"))
             else:
                 LOGGER.info("Recorded failure for %s (attempt %s)", path, info.get("attempts"))
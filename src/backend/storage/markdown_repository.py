@@ -8,6 +8,26 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson  # C-level JSON for metadata on the save/hydration paths
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore
+
+_UTC = dt.timezone.utc
+
+
+def _dump_metadata(metadata: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(metadata, sort_keys=True)
+
+
+def _load_metadata(raw: str) -> dict:
+    try:
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:
+        return {"raw": raw}
+
 
 @dataclass
 class MarkdownRecord:
@@ -18,11 +38,21 @@ class MarkdownRecord:
     created_at: dt.datetime
     content_hash: Optional[str] = None
     metadata: Optional[dict] = None
+    file_hash: Optional[str] = None
 
 
 class MarkdownRepository:
     """Persist markdown exports of PDFs in a lightweight SQLite database."""
 
+    # Hot statements, hoisted so every call reuses the identical SQL text and
+    # hits the connection's prepared-statement cache.
+    _SQL_GET_BY_ID = "SELECT * FROM documents WHERE id = ?"
+    _SQL_GET_BY_TITLE = "SELECT * FROM documents WHERE title = ?"
+    _SQL_GET_BY_SOURCE = "SELECT * FROM documents WHERE source_path = ?"
+    _SQL_GET_BY_HASH = "SELECT * FROM documents WHERE content_hash = ?"
+    _SQL_GET_BY_FILE_HASH = "SELECT * FROM documents WHERE file_hash = ?"
+    _SQL_IS_BLACKLISTED = "SELECT blacklisted FROM failed_files WHERE source_path = ?"
+
     def __init__(self, database_url: str) -> None:
         if not database_url.startswith("sqlite"):
             raise ValueError("Only sqlite databases are supported in this reference implementation")
@@ -30,7 +60,10 @@ class MarkdownRepository:
         self.database_url = database_url
         self._db_path = self._resolve_db_path(database_url)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # WAL lets readers run lock-free alongside one writer; the lock only
+        # serializes writes from this process.
         self._lock = threading.RLock()
+        self._tls = threading.local()
         self._ensure_schema()
 
     @staticmethod
@@ -41,15 +74,26 @@ class MarkdownRepository:
             raise ValueError("Relative sqlite URLs are not supported. Use sqlite:///absolute/path.db")
         return Path(database_url)
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return this thread's cached connection, creating it on first use."""
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            # A larger statement cache keeps the watcher's repeated lookups
+            # prepared instead of re-parsed per call.
+            conn = sqlite3.connect(self._db_path, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-64000")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._tls.conn = conn
         return conn
 
     def _ensure_schema(self) -> None:
         with self._lock:
-            with self._connect() as conn:
-                conn.execute(
+            conn = self._get_conn()
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS documents (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -58,17 +102,20 @@ class MarkdownRepository:
                     markdown TEXT NOT NULL,
                     created_at TEXT NOT NULL,
                     content_hash TEXT,
-                    metadata TEXT
+                    metadata TEXT,
+                    file_hash TEXT
                 )
                 """
             )
-                columns = {row[1] for row in conn.execute("PRAGMA table_info(documents)")}
-                if "content_hash" not in columns:
-                    conn.execute("ALTER TABLE documents ADD COLUMN content_hash TEXT")
-                if "metadata" not in columns:
-                    conn.execute("ALTER TABLE documents ADD COLUMN metadata TEXT")
-                # Track failed processing attempts and blacklist status
-                conn.execute(
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(documents)")}
+            if "content_hash" not in columns:
+                conn.execute("ALTER TABLE documents ADD COLUMN content_hash TEXT")
+            if "metadata" not in columns:
+                conn.execute("ALTER TABLE documents ADD COLUMN metadata TEXT")
+            if "file_hash" not in columns:
+                conn.execute("ALTER TABLE documents ADD COLUMN file_hash TEXT")
+            # Track failed processing attempts and blacklist status
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS failed_files (
                     source_path TEXT PRIMARY KEY,
@@ -79,7 +126,15 @@ class MarkdownRepository:
                 )
                 """
             )
-                conn.commit()
+            # Equality lookups on these columns back every hot read path;
+            # non-unique because re-ingested paths and repeated titles are
+            # legal in the current schema.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_source ON documents(source_path)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_hash ON documents(content_hash)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_file_hash ON documents(file_hash)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_title ON documents(title)")
+            conn.execute("ANALYZE")
+            conn.commit()
 
     def save(
         self,
@@ -89,20 +144,21 @@ class MarkdownRepository:
         *,
         content_hash: Optional[str] = None,
         metadata: Optional[dict] = None,
+        file_hash: Optional[str] = None,
     ) -> MarkdownRecord:
-        now = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc)
-        metadata_json = json.dumps(metadata, sort_keys=True) if metadata else None
+        now = dt.datetime.now(_UTC)
+        metadata_json = _dump_metadata(metadata) if metadata else None
         with self._lock:
-            with self._connect() as conn:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO documents (title, source_path, markdown, created_at, content_hash, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (title, str(source_path), markdown, now.isoformat(), content_hash, metadata_json),
-                )
-                doc_id = int(cursor.lastrowid)
-                conn.commit()
+            conn = self._get_conn()
+            cursor = conn.execute(
+                """
+                INSERT INTO documents (title, source_path, markdown, created_at, content_hash, metadata, file_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (title, str(source_path), markdown, now.isoformat(), content_hash, metadata_json, file_hash),
+            )
+            doc_id = int(cursor.lastrowid)
+            conn.commit()
         return MarkdownRecord(
             id=doc_id,
             title=title,
@@ -111,95 +167,112 @@ class MarkdownRepository:
             created_at=now,
             content_hash=content_hash,
             metadata=metadata,
+            file_hash=file_hash,
         )
 
     def get_by_id(self, document_id: int) -> Optional[MarkdownRecord]:
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute("SELECT * FROM documents WHERE id = ?", (document_id,)).fetchone()
-                if not row:
-                    return None
-                return self._row_to_record(row)
+        row = self._get_conn().execute(self._SQL_GET_BY_ID, (document_id,)).fetchone()
+        if not row:
+            return None
+        return self._row_to_record(row)
+
+    def get_by_ids(self, document_ids: list[int]) -> dict[int, MarkdownRecord]:
+        """Fetch several documents in one round trip, keyed by id."""
+        if not document_ids:
+            return {}
+        placeholders = ",".join("?" * len(document_ids))
+        rows = self._get_conn().execute(
+            f"SELECT * FROM documents WHERE id IN ({placeholders})",
+            [int(document_id) for document_id in document_ids],
+        ).fetchall()
+        return {record.id: record for record in map(self._row_to_record, rows)}
 
     def get_by_title(self, title: str) -> Optional[MarkdownRecord]:
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute("SELECT * FROM documents WHERE title = ?", (title,)).fetchone()
-                if not row:
-                    return None
-                return self._row_to_record(row)
+        row = self._get_conn().execute(self._SQL_GET_BY_TITLE, (title,)).fetchone()
+        if not row:
+            return None
+        return self._row_to_record(row)
 
     def get_by_source_path(self, source_path: str) -> Optional[MarkdownRecord]:
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute("SELECT * FROM documents WHERE source_path = ?", (str(source_path),)).fetchone()
-                if not row:
-                    return None
-                return self._row_to_record(row)
+        row = self._get_conn().execute(
+            self._SQL_GET_BY_SOURCE, (str(source_path),)
+        ).fetchone()
+        if not row:
+            return None
+        return self._row_to_record(row)
 
     def get_by_hash(self, content_hash: str) -> Optional[MarkdownRecord]:
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute("SELECT * FROM documents WHERE content_hash = ?", (content_hash,)).fetchone()
-                if not row:
-                    return None
-                return self._row_to_record(row)
+        row = self._get_conn().execute(
+            self._SQL_GET_BY_HASH, (content_hash,)
+        ).fetchone()
+        if not row:
+            return None
+        return self._row_to_record(row)
+
+    def get_by_file_hash(self, file_hash: str) -> Optional[MarkdownRecord]:
+        row = self._get_conn().execute(
+            self._SQL_GET_BY_FILE_HASH, (file_hash,)
+        ).fetchone()
+        if not row:
+            return None
+        return self._row_to_record(row)
 
     def record_failure(self, source_path: str, error: str, max_attempts: int) -> dict:
         """Increment failure counter for a file and mark blacklisted if attempts exceed max_attempts.
 
         Returns a dict with attempts and blacklisted status.
         """
-        now = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc).isoformat()
+        now = dt.datetime.now(_UTC).isoformat()
         with self._lock:
-            with self._connect() as conn:
-                row = conn.execute("SELECT attempts, blacklisted FROM failed_files WHERE source_path = ?", (str(source_path),)).fetchone()
-                if not row:
-                    attempts = 1
-                    blacklisted = 0
-                    conn.execute(
-                        "INSERT INTO failed_files (source_path, attempts, last_error, blacklisted, updated_at) VALUES (?, ?, ?, ?, ?)",
-                        (str(source_path), attempts, error, blacklisted, now),
-                    )
-                else:
-                    attempts = int(row["attempts"]) + 1
-                    blacklisted = int(row["blacklisted"])
-                    if attempts >= max_attempts:
-                        blacklisted = 1
-                    conn.execute(
-                        "UPDATE failed_files SET attempts = ?, last_error = ?, blacklisted = ?, updated_at = ? WHERE source_path = ?",
-                        (attempts, error, blacklisted, now, str(source_path)),
-                    )
-                conn.commit()
-        return {"attempts": attempts, "blacklisted": bool(blacklisted)}
+            conn = self._get_conn()
+            row = conn.execute(
+                """
+                INSERT INTO failed_files (source_path, attempts, last_error, blacklisted, updated_at)
+                VALUES (?, 1, ?, 0, ?)
+                ON CONFLICT(source_path) DO UPDATE SET
+                    attempts = attempts + 1,
+                    last_error = excluded.last_error,
+                    updated_at = excluded.updated_at,
+                    blacklisted = CASE WHEN attempts + 1 >= ? THEN 1 ELSE blacklisted END
+                RETURNING attempts, blacklisted
+                """,
+                (str(source_path), error, now, max_attempts),
+            ).fetchone()
+            conn.commit()
+        attempts = int(row["attempts"])
+        blacklisted = bool(row["blacklisted"])
+        return {"attempts": attempts, "blacklisted": blacklisted}
 
     def clear_failures(self, source_path: str) -> None:
         with self._lock:
-            with self._connect() as conn:
-                conn.execute("DELETE FROM failed_files WHERE source_path = ?", (str(source_path),))
-                conn.commit()
+            conn = self._get_conn()
+            conn.execute("DELETE FROM failed_files WHERE source_path = ?", (str(source_path),))
+            conn.commit()
 
     def is_blacklisted(self, source_path: str) -> bool:
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute("SELECT blacklisted FROM failed_files WHERE source_path = ?", (str(source_path),)).fetchone()
-                if not row:
-                    return False
-                return bool(row["blacklisted"])
+        row = self._get_conn().execute(
+            self._SQL_IS_BLACKLISTED, (str(source_path),)
+        ).fetchone()
+        if not row:
+            return False
+        return bool(row["blacklisted"])
+
+    def iter_source_paths(self) -> list[str]:
+        """Return every ingested source path without loading markdown bodies."""
+        rows = self._get_conn().execute("SELECT source_path FROM documents").fetchall()
+        return [row["source_path"] for row in rows]
+
+    def iter_blacklisted_paths(self) -> list[str]:
+        """Return every blacklisted source path."""
+        rows = self._get_conn().execute("SELECT source_path FROM failed_files WHERE blacklisted = 1").fetchall()
+        return [row["source_path"] for row in rows]
 
     def list_all(self) -> list[MarkdownRecord]:
-        with self._lock:
-            with self._connect() as conn:
-                rows = conn.execute("SELECT * FROM documents ORDER BY created_at DESC").fetchall()
-                return [self._row_to_record(row) for row in rows]
+        rows = self._get_conn().execute("SELECT * FROM documents ORDER BY created_at DESC").fetchall()
+        return [self._row_to_record(row) for row in rows]
 
     def _row_to_record(self, row: sqlite3.Row) -> MarkdownRecord:
-        metadata = None
-        if row["metadata"]:
-            try:
-                metadata = json.loads(row["metadata"])
-            except json.JSONDecodeError:
-                metadata = {"raw": row["metadata"]}
+        metadata = _load_metadata(row["metadata"]) if row["metadata"] else None
         return MarkdownRecord(
             id=row["id"],
             title=row["title"],
@@ -208,4 +281,5 @@ class MarkdownRepository:
             created_at=dt.datetime.fromisoformat(row["created_at"]),
             content_hash=row["content_hash"],
             metadata=metadata,
+            file_hash=row["file_hash"],
         )
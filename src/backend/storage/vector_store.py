@@ -1,21 +1,25 @@
 from __future__ import annotations
 
 import datetime as dt
+import itertools
 import logging
 import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
-import lancedb
-import pyarrow as pa
-from pyarrow import types as pa_types
+import numpy as np
 
 from ..embeddings.embedding_manager import EmbeddingResult
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import pyarrow as pa
+
 
 LOGGER = logging.getLogger(__name__)
 
+_UTC = dt.timezone.utc
+
 
 @dataclass
 class VectorStoreRecord:
@@ -28,124 +32,437 @@ class VectorStoreRecord:
 
 
 class VectorStore:
-    """Vector store implementation backed by LanceDB for similarity search."""
+    """Vector store implementation backed by LanceDB for similarity search.
+
+    With ``quantization="fp16"`` vectors are stored half-precision (2x
+    smaller) and searched natively by LanceDB. With ``"int8"`` they are
+    scalar-quantized (4x smaller); LanceDB cannot scan int8 columns, so
+    queries score a cached dequantized matrix with one BLAS product instead.
+    """
 
     TABLE_NAME = "embeddings"
 
-    def __init__(self, db_path: str, embedding_dim: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        embedding_dim: Optional[int] = None,
+        quantization: str = "fp32",
+        hnsw_m: int = 32,
+        hnsw_ef_construction: int = 200,
+    ) -> None:
+        # Deferred so importing this module (and anything that transitively
+        # pulls it in, like create_api at test time) doesn't pay the native
+        # lancedb/pyarrow load until a store is actually constructed.
+        import lancedb
+        import pyarrow
+        from pyarrow import types as pyarrow_types
+
+        self._pa = pyarrow
+        self._pa_types = pyarrow_types
         self._db_root = Path(db_path).expanduser().resolve()
         self._db_root.mkdir(parents=True, exist_ok=True)
         self._db = lancedb.connect(str(self._db_root))
         self._embedding_dim: Optional[int] = embedding_dim if embedding_dim and embedding_dim > 0 else None
-        self._lock = threading.RLock()
+        self._hnsw_m = hnsw_m
+        self._hnsw_ef_construction = hnsw_ef_construction
+        self._quantization = quantization.lower()
+        if self._quantization not in ("fp32", "fp16", "int8"):
+            raise ValueError(f"Unsupported embedding quantization: {quantization}")
+        # Reads (LanceDB searches) are thread-safe without locking; only
+        # writes and cache mutations serialize on this.
+        self._write_lock = threading.Lock()
+        # Lazily rebuilt snapshot of the quantized corpus for int8 scoring.
+        self._int8_cache: Optional[dict] = None
+        # Fresh tables only ever hold rows normalized at insert, where the
+        # dot metric equals cosine; pre-existing tables may contain
+        # unnormalized rows, so _ensure_table downgrades this to "cosine"
+        # (scale-invariant) for them.
+        self._metric = "dot"
+        self._index_verified = False
         self._table = self._ensure_table()
+        # Checked on every search; count_rows() is a metadata scan we only
+        # pay once here and never again after the first insert.
+        self._nonempty = self._table is not None and self._table.count_rows() > 0
 
-    def _vector_field(self, dimension: int) -> pa.Field:
-        return pa.field("vector", pa.list_(pa.float32(), list_size=dimension))
+    def _vector_field(self, dimension: int) -> "pa.Field":
+        elements = {"int8": self._pa.int8(), "fp16": self._pa.float16()}
+        element = elements.get(self._quantization, self._pa.float32())
+        return self._pa.field("vector", self._pa.list_(element, list_size=dimension))
 
     def _ensure_table(self):
-        with self._lock:
-            if self.TABLE_NAME in self._db.table_names():
-                table = self._db.open_table(self.TABLE_NAME)
-                vector_field = table.schema.field("vector")
-                if pa_types.is_list(vector_field.type) and not pa_types.is_fixed_size_list(vector_field.type):
-                    LOGGER.warning("Detected legacy LanceDB schema; rebuilding embeddings table with fixed-size vectors")
-                    rows = table.to_arrow().to_pylist()
-                    self._db.drop_table(self.TABLE_NAME)
-                    self._embedding_dim = self._embedding_dim or (len(rows[0]["vector"]) if rows else None)
-                    table = self._create_table(self._embedding_dim)
-                    if rows:
-                        table.add(rows)
+        if self.TABLE_NAME in self._db.table_names():
+            table = self._db.open_table(self.TABLE_NAME)
+            vector_field = table.schema.field("vector")
+            if self._pa_types.is_fixed_size_list(vector_field.type):
+                if self._pa.types.is_int8(vector_field.type.value_type):
+                    stored = "int8"
+                elif self._pa.types.is_float16(vector_field.type.value_type):
+                    stored = "fp16"
                 else:
-                    if self._embedding_dim is None and pa_types.is_fixed_size_list(vector_field.type):
-                        self._embedding_dim = vector_field.type.list_size
-                if table and not table.list_indices():
-                    table.create_index(column="vector", metric="cosine")
-                return table
-
-            table = self._create_table(self._embedding_dim)
+                    stored = "fp32"
+                if stored != self._quantization:
+                    LOGGER.warning(
+                        "Existing embeddings table is %s but settings request %s; keeping %s",
+                        stored, self._quantization, stored,
+                    )
+                    self._quantization = stored
+            if self._pa_types.is_list(vector_field.type) and not self._pa_types.is_fixed_size_list(vector_field.type):
+                LOGGER.warning("Detected legacy LanceDB schema; rebuilding embeddings table with fixed-size vectors")
+                table = self._rebuild_legacy_table(table)
+            else:
+                if self._embedding_dim is None and self._pa_types.is_fixed_size_list(vector_field.type):
+                    self._embedding_dim = vector_field.type.list_size
+                # Rows written before this code normalized on insert make the
+                # dot shortcut unsafe; follow the existing index's metric, or
+                # fall back to cosine, which ranks correctly either way.
+                self._metric = self._index_metric(table) or "cosine"
+            if table and self._quantization != "int8":
+                self._maybe_create_index(table)
             return table
 
+        table = self._create_table(self._embedding_dim)
+        return table
+
+    def _rebuild_legacy_table(self, table):
+        """Migrate a variable-length-list table to the fixed-size schema.
+
+        Rows move as columnar Arrow batches, never as Python dicts. The
+        batches are materialized before the old table is dropped (they must
+        survive it), but that is compact Arrow data, not per-row objects.
+        Vectors go through the same normalize/quantize encoding as fresh
+        inserts, so migrated tables match the configured quantization and
+        are safe for the dot metric.
+        """
+        try:
+            batches = list(table.to_lance().to_batches(batch_size=4096))
+        except (AttributeError, ImportError):  # no pylance dataset handle available
+            batches = table.to_arrow().to_batches(max_chunksize=4096)
+        if self._embedding_dim is None and batches and batches[0].num_rows:
+            self._embedding_dim = len(batches[0].column("vector")[0])
+        self._db.drop_table(self.TABLE_NAME)
+        new_table = self._create_table(self._embedding_dim)
+        if new_table is not None:
+            for batch in batches:
+                if not batch.num_rows:
+                    continue
+                new_table.add(self._convert_legacy_batch(batch))
+        return new_table
+
+    def _convert_legacy_batch(self, batch):
+        """Re-encode one legacy Arrow batch into the current schema."""
+        chunk = self._pa.Table.from_batches([batch])
+        flat = np.asarray(chunk["vector"].combine_chunks().flatten(), dtype=np.float32)
+        matrix, scales = self._encode_matrix(flat.reshape(-1, self._embedding_dim))
+        arrays = [
+            chunk["document_id"].combine_chunks().cast(self._pa.int64()),
+            chunk["chunk_index"].combine_chunks().cast(self._pa.int32()),
+            self._pa.FixedSizeListArray.from_arrays(self._pa.array(matrix.reshape(-1)), self._embedding_dim),
+            chunk["provider"].combine_chunks().cast(self._pa.string()),
+            chunk["model"].combine_chunks().cast(self._pa.string()),
+            chunk["text"].combine_chunks().cast(self._pa.string()),
+            chunk["created_at"].combine_chunks().cast(self._pa.timestamp("us")),
+        ]
+        names = ["document_id", "chunk_index", "vector", "provider", "model", "text", "created_at"]
+        if scales is not None:
+            arrays.append(self._pa.array(scales))
+            names.append("scale")
+        return self._pa.Table.from_arrays(arrays, names=names)
+
     def _create_table(self, dimension: Optional[int]):
         if dimension is None:
             return None
 
-        schema = pa.schema(
-            [
-                pa.field("document_id", pa.int64()),
-                pa.field("chunk_index", pa.int32()),
-                self._vector_field(dimension),
-                pa.field("provider", pa.string()),
-                pa.field("model", pa.string()),
-                pa.field("text", pa.string()),
-                pa.field("created_at", pa.timestamp("us")),
-            ]
-        )
-        table = self._db.create_table(self.TABLE_NAME, schema=schema)
-        table.create_index(column="vector", metric="cosine")
-        return table
+        fields = [
+            self._pa.field("document_id", self._pa.int64()),
+            self._pa.field("chunk_index", self._pa.int32()),
+            self._vector_field(dimension),
+            self._pa.field("provider", self._pa.string()),
+            self._pa.field("model", self._pa.string()),
+            self._pa.field("text", self._pa.string()),
+            self._pa.field("created_at", self._pa.timestamp("us")),
+        ]
+        if self._quantization == "int8":
+            fields.append(self._pa.field("scale", self._pa.float32()))
+        # Index creation is deferred until enough rows exist to train it.
+        return self._db.create_table(self.TABLE_NAME, schema=self._pa.schema(fields))
+
+    # Rows buffered per table.add call when consuming an embedding stream.
+    ADD_BATCH_SIZE = 256
+    # ANN index training needs a sample of rows; tiny tables brute-force fine.
+    MIN_ROWS_FOR_INDEX = 256
+
+    def _index_metric(self, table) -> Optional[str]:
+        """Return the distance metric of the table's vector index, if any."""
+        try:
+            for index in table.list_indices():
+                if "vector" in getattr(index, "columns", ()):
+                    distance = getattr(table.index_stats(index.name), "distance_type", None)
+                    if distance:
+                        return str(distance).lower()
+        except Exception:  # pragma: no cover - defensive metadata guard
+            LOGGER.debug("Could not read vector index metric", exc_info=True)
+        return None
+
+    def _maybe_create_index(self, table) -> None:
+        """Build an HNSW ANN index once the table is big enough to train one.
+
+        Search complexity drops from the flat O(N·d) scan to roughly
+        logarithmic in corpus size. An existing index whose metric no longer
+        matches the search metric is dropped and rebuilt — searching dot
+        against a cosine index (or vice versa) silently degrades to a
+        brute-force scan. Falls back to the plain IVF index on LanceDB
+        versions without HNSW index types.
+        """
+        if table is None or self._index_verified:
+            return
+        existing_metric = self._index_metric(table)
+        if existing_metric == self._metric:
+            self._index_verified = True
+            return
+        if existing_metric is not None:
+            LOGGER.warning(
+                "Vector index uses %s but searches use %s; rebuilding index", existing_metric, self._metric
+            )
+            try:
+                for index in table.list_indices():
+                    table.drop_index(index.name)
+            except Exception:  # pragma: no cover - defensive index guard
+                LOGGER.warning("Failed to drop mismatched vector index", exc_info=True)
+                return
+        elif table.list_indices():
+            # An index exists but its metric is unreadable; leave it alone.
+            self._index_verified = True
+            return
+        row_count = table.count_rows()
+        if row_count < self.MIN_ROWS_FOR_INDEX:
+            return
+        try:
+            table.create_index(
+                metric=self._metric,
+                vector_column_name="vector",
+                index_type="IVF_HNSW_SQ",
+                num_partitions=max(1, row_count // 4096),
+                m=self._hnsw_m,
+                ef_construction=self._hnsw_ef_construction,
+            )
+            LOGGER.info("Created IVF_HNSW_SQ vector index (%s) over %d rows", self._metric, row_count)
+            self._index_verified = True
+        except TypeError:
+            # Older LanceDB without HNSW index types.
+            try:
+                table.create_index(metric=self._metric, vector_column_name="vector")
+                LOGGER.info("Created default vector index (%s) over %d rows", self._metric, row_count)
+                self._index_verified = True
+            except Exception:  # pragma: no cover - defensive index guard
+                LOGGER.warning("Failed to create fallback vector index", exc_info=True)
+        except Exception:  # pragma: no cover - defensive index guard
+            LOGGER.warning("Failed to create vector index", exc_info=True)
 
     def add_embeddings(self, document_id: int, embeddings: Iterable[EmbeddingResult]) -> None:
-        embeddings = list(embeddings)
-        if not embeddings:
+        iterator = iter(embeddings)
+        first = next(iterator, None)
+        if first is None:
             return
 
-        with self._lock:
-            rows = []
-            first_vector = embeddings[0].vector
-            if self._embedding_dim is None:
-                self._embedding_dim = len(first_vector)
-                if self._table is None:
-                    self._table = self._create_table(self._embedding_dim)
+        self._ensure_ready(first)
+
+        # Consume the (possibly lazy) stream in bounded batches so upstream
+        # embedding work happens outside the lock and peak memory stays at
+        # ADD_BATCH_SIZE rows.
+        batch: List[EmbeddingResult] = []
+        next_index = 0
+        for embedding in itertools.chain((first,), iterator):
+            if len(embedding.vector) != self._embedding_dim:
+                raise ValueError(
+                    f"Embedding dimension mismatch: expected {self._embedding_dim}, got {len(embedding.vector)}"
+                )
+            batch.append(embedding)
+            if len(batch) >= self.ADD_BATCH_SIZE:
+                next_index = self._flush_batch(document_id, batch, next_index)
+                batch = []
+        if batch:
+            self._flush_batch(document_id, batch, next_index)
+        with self._write_lock:
+            self._int8_cache = None
+            self._nonempty = True
+            if self._quantization != "int8":
+                self._maybe_create_index(self._table)
 
+    def _ensure_ready(self, first: EmbeddingResult) -> None:
+        """Pin the embedding dimension and create the table on first insert."""
+        with self._write_lock:
+            if self._embedding_dim is None:
+                self._embedding_dim = len(first.vector)
             if self._table is None and self._embedding_dim is not None:
                 self._table = self._create_table(self._embedding_dim)
-
             if self._embedding_dim is None or self._table is None:
                 raise ValueError("Embedding dimension could not be determined for LanceDB table creation")
 
-            for chunk_index, embedding in enumerate(embeddings):
+    def _flush_batch(self, document_id: int, batch: List[EmbeddingResult], start_index: int) -> int:
+        count = len(batch)
+        record_batch = self._build_record_batch(
+            batch,
+            np.full(count, document_id, dtype=np.int64),
+            np.arange(start_index, start_index + count, dtype=np.int32),
+        )
+        with self._write_lock:
+            self._table.add(record_batch)
+        return start_index + count
+
+    def _encode_matrix(self, matrix: np.ndarray) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """Normalize a (N, d) float32 matrix and apply the configured quantization."""
+        # Normalize once at insert; with unit vectors the dot metric equals
+        # cosine without any per-search normalization.
+        matrix = matrix / (np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12)
+        if self._quantization == "int8":
+            scales = np.max(np.abs(matrix), axis=1) / 127.0
+            safe = np.where(scales == 0.0, 1.0, scales)
+            return np.round(matrix / safe[:, None]).astype(np.int8), scales
+        if self._quantization == "fp16":
+            return matrix.astype(np.float16), None
+        return matrix, None
+
+    def _build_record_batch(self, batch: List[EmbeddingResult], document_ids: np.ndarray, chunk_indexes: np.ndarray):
+        # One contiguous (N, d) float32 buffer per batch; the Arrow vector
+        # column is built zero-copy from it, and int8 quantization runs
+        # vectorized over the matrix.
+        matrix = np.stack([embedding.vector for embedding in batch]).astype(np.float32, copy=False)
+        matrix, scales = self._encode_matrix(matrix)
+        count = len(batch)
+        dimension = matrix.shape[1]
+        now = dt.datetime.now(_UTC)
+        arrays = [
+            self._pa.array(document_ids),
+            self._pa.array(chunk_indexes),
+            self._pa.FixedSizeListArray.from_arrays(self._pa.array(matrix.reshape(-1)), dimension),
+            self._pa.array([embedding.provider for embedding in batch], self._pa.string()),
+            self._pa.array([embedding.model for embedding in batch], self._pa.string()),
+            self._pa.array([embedding.text for embedding in batch], self._pa.string()),
+            self._pa.array([now] * count, self._pa.timestamp("us")),
+        ]
+        names = ["document_id", "chunk_index", "vector", "provider", "model", "text", "created_at"]
+        if scales is not None:
+            arrays.append(self._pa.array(scales))
+            names.append("scale")
+        return self._pa.RecordBatch.from_arrays(arrays, names=names)
+
+    def add_embeddings_bulk(self, entries: List[tuple[int, List[EmbeddingResult]]]) -> None:
+        """Write several documents' embeddings in one LanceDB commit.
+
+        Amortizes the per-add commit/manifest overhead when a batch of small
+        documents (e.g. a watcher catch-up) lands together.
+        """
+        entries = [(document_id, list(embeddings)) for document_id, embeddings in entries]
+        entries = [(document_id, embeddings) for document_id, embeddings in entries if embeddings]
+        if not entries:
+            return
+        self._ensure_ready(entries[0][1][0])
+        flat: List[EmbeddingResult] = []
+        document_ids: List[np.ndarray] = []
+        chunk_indexes: List[np.ndarray] = []
+        for document_id, embeddings in entries:
+            for embedding in embeddings:
                 if len(embedding.vector) != self._embedding_dim:
                     raise ValueError(
                         f"Embedding dimension mismatch: expected {self._embedding_dim}, got {len(embedding.vector)}"
                     )
-                rows.append(
-                    {
-                        "document_id": document_id,
-                        "chunk_index": chunk_index,
-                        "vector": embedding.vector,
-                        "provider": embedding.provider,
-                        "model": embedding.model,
-                        "text": embedding.text,
-                        "created_at": dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc),
-                    }
+            flat.extend(embeddings)
+            document_ids.append(np.full(len(embeddings), document_id, dtype=np.int64))
+            chunk_indexes.append(np.arange(len(embeddings), dtype=np.int32))
+        record_batch = self._build_record_batch(flat, np.concatenate(document_ids), np.concatenate(chunk_indexes))
+        with self._write_lock:
+            self._table.add(record_batch)
+            self._int8_cache = None
+            self._nonempty = True
+            if self._quantization != "int8":
+                self._maybe_create_index(self._table)
+
+    @staticmethod
+    def _prepare_query(query_vector: "np.ndarray | List[float]") -> np.ndarray:
+        """Pack a query into a normalized, C-contiguous float32 vector.
+
+        Callers that already hold a float32 ndarray (the embedding caches)
+        skip the Python-list coercion entirely; everything downstream — the
+        LanceDB dot search and the int8 GEMV — consumes the buffer as-is.
+        """
+        query = np.ascontiguousarray(query_vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        return query / norm if norm else query
+
+    def similarity_search(self, query_vector: "np.ndarray | List[float]", top_k: int = 5) -> List[VectorStoreRecord]:
+        if query_vector is None or len(query_vector) == 0:
+            return []
+        if not self._nonempty:
+            return []
+
+        if self._quantization == "int8":
+            return self._similarity_search_int8(query_vector, top_k)
+
+        # Lock-free read: LanceDB searches are safe against concurrent adds.
+        query = self._prepare_query(query_vector)
+        # _metric is "dot" only for tables whose rows were normalized on
+        # insert, where dot distance (1 - dot) equals cosine distance, so the
+        # similarity mapping below holds for both metrics.
+        results = self._table.search(query).metric(self._metric).limit(top_k).to_list()
+        records: List[VectorStoreRecord] = []
+        for row in results:
+            distance = float(row.get("_distance", row.get("score", 1.0)))
+            similarity = max(0.0, 1.0 - distance)
+            records.append(
+                VectorStoreRecord(
+                    document_id=int(row["document_id"]),
+                    chunk_index=int(row["chunk_index"]),
+                    similarity=similarity,
+                    text=row.get("text", ""),
+                    provider=row.get("provider", "unknown"),
+                    model=row.get("model", "unknown"),
                 )
-            if rows:
-                self._table.add(rows)
-                if not self._table.list_indices():
-                    self._table.create_index(column="vector", metric="cosine")
+            )
+        return records
 
-    def similarity_search(self, query_vector: List[float], top_k: int = 5) -> List[VectorStoreRecord]:
-        if not query_vector:
+    def _similarity_search_int8(self, query_vector: "np.ndarray | List[float]", top_k: int) -> List[VectorStoreRecord]:
+        cache = self._int8_corpus()
+        if cache is None:
             return []
+        query = self._prepare_query(query_vector)
+        # One BLAS GEMV over the pre-dequantized contiguous matrix; numpy
+        # integer matmul has no BLAS path and would copy the matrix per query.
+        scores = cache["matrix"] @ query
+        top_k = min(top_k, scores.shape[0])
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            VectorStoreRecord(
+                document_id=int(cache["document_ids"][index]),
+                chunk_index=int(cache["chunk_indexes"][index]),
+                similarity=max(0.0, float(scores[index])),
+                text=cache["texts"][index],
+                provider=cache["providers"][index],
+                model=cache["models"][index],
+            )
+            for index in top
+        ]
 
-        with self._lock:
+    def _int8_corpus(self) -> Optional[dict]:
+        with self._write_lock:
+            if self._int8_cache is not None:
+                return self._int8_cache
             if self._table is None or self._table.count_rows() == 0:
-                return []
-
-            results = self._table.search(query_vector).metric("cosine").limit(top_k).to_list()
-            records: List[VectorStoreRecord] = []
-            for row in results:
-                distance = float(row.get("_distance", row.get("score", 1.0)))
-                similarity = max(0.0, 1.0 - distance)
-                records.append(
-                    VectorStoreRecord(
-                        document_id=int(row["document_id"]),
-                        chunk_index=int(row["chunk_index"]),
-                        similarity=similarity,
-                        text=row.get("text", ""),
-                        provider=row.get("provider", "unknown"),
-                        model=row.get("model", "unknown"),
-                    )
-                )
-            return records
+                return None
+            data = self._table.to_arrow()
+            matrix = np.asarray(data["vector"].combine_chunks().flatten(), dtype=np.int8)
+            scales = np.asarray(data["scale"], dtype=np.float32)
+            # Dequantize once at cache-build time into a C-contiguous float32
+            # matrix so every query is a single BLAS call; disk stays int8.
+            dequantized = matrix.reshape(-1, self._embedding_dim).astype(np.float32)
+            dequantized *= scales[:, None]
+            self._int8_cache = {
+                "matrix": np.ascontiguousarray(dequantized),
+                "scales": scales,
+                "document_ids": data["document_id"].to_pylist(),
+                "chunk_indexes": data["chunk_index"].to_pylist(),
+                "texts": data["text"].to_pylist(),
+                "providers": data["provider"].to_pylist(),
+                "models": data["model"].to_pylist(),
+            }
+            return self._int8_cache
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.backend.config import Settings  # noqa: E402
+from src.backend.embeddings.embedding_manager import EmbeddingManager, EmbeddingResult  # noqa: E402
+
+
+def _fake_embed(texts, batch_size=None):
+    return [
+        EmbeddingResult(text=text, vector=np.ones(4, dtype=np.float32), model="m", provider="p")
+        for text in texts
+    ]
+
+
+def test_chunk_markdown_windows_cover_document() -> None:
+    text = " ".join(f"w{i}" for i in range(1500))
+
+    chunks = EmbeddingManager.chunk_markdown(text, chunk_size=700, overlap=50)
+
+    assert [chunk.split()[0] for chunk in chunks] == ["w0", "w650", "w1300"]
+    assert chunks[-1].split()[-1] == "w1499"
+    assert EmbeddingManager.chunk_markdown("") == []
+
+
+def test_embed_documents_streaming_preserves_order() -> None:
+    manager = EmbeddingManager(Settings(embedding_batch_size=3))
+    manager.embed_documents = _fake_embed  # type: ignore[method-assign]
+
+    texts = [f"chunk {i} " + "x" * (17 * i % 29) for i in range(20)]
+    results = list(manager.embed_documents_streaming(iter(texts)))
+
+    assert [result.text for result in results] == texts
+
+
+def test_embed_documents_streaming_is_lazy() -> None:
+    manager = EmbeddingManager(Settings(embedding_batch_size=2, embedding_smart_batching=False))
+    manager.embed_documents = _fake_embed  # type: ignore[method-assign]
+
+    pulled = []
+
+    def chunk_source():
+        for i in range(10):
+            pulled.append(i)
+            yield f"chunk {i}"
+
+    stream = manager.embed_documents_streaming(chunk_source())
+    next(stream)
+
+    # Only the first batch was drawn from the generator.
+    assert pulled == [0, 1]
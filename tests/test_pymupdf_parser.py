@@ -29,4 +29,22 @@ def test_pymupdf_parser_extracts_markdown(tmp_path: Path) -> None:
     parser = PyMuPDFParser()
     markdown = parser.parse_to_markdown(pdf_path)
 
-    assert "Hello PyMuPDF" in markdown
\ No newline at end of file
+    assert "Hello PyMuPDF" in markdown
+
+
+def test_pymupdf_parser_parallel_matches_sequential(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "multi.pdf"
+
+    doc = fitz.open()
+    for index in range(12):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {index} body")
+    doc.save(pdf_path)
+    doc.close()
+
+    sequential = PyMuPDFParser(parallel_pages=False).parse_to_markdown(pdf_path)
+    parallel = PyMuPDFParser(parallel_pages=True).parse_to_markdown(pdf_path)
+
+    assert parallel == sequential
+    positions = [parallel.index(f"Page {index} body") for index in range(12)]
+    assert positions == sorted(positions)
\ No newline at end of file